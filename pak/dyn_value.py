@@ -83,6 +83,10 @@ class DynamicValue(abc.ABC):
     _enabled = None
 
     def __new__(cls, initial_value):
+        # Values which are already dynamic don't need to be converted again.
+        if isinstance(initial_value, DynamicValue):
+            return initial_value
+
         for subclass in util.subclasses(DynamicValue):
             if subclass._enabled and isinstance(initial_value, subclass._type):
                 return subclass(initial_value)
@@ -77,10 +77,28 @@ class AlignedPacket(Packet):
 
         self = object.__new__(cls)
 
-        buf = util.file_object(buf)
-
         type_ctx = self.type_ctx(ctx)
-        for (field, field_type), padding_amount in zip(cls.enumerate_field_types(), cls._padding_lengths(type_ctx=type_ctx)):
+
+        if isinstance(buf, (bytes, bytearray)):
+            buf    = bytes(buf)
+            offset = 0
+
+            for (field, field_type), padding_amount in zip(cls._fields_items, cls._padding_lengths(type_ctx=type_ctx)):
+                value, offset = field_type.unpack_from(buf, offset, ctx=type_ctx)
+                offset += padding_amount
+
+                try:
+                    setattr(self, field, value)
+
+                except AttributeError:
+                    # If trying to set an unpacked value fails
+                    # (like if the attribute is read-only)
+                    # then just move on.
+                    pass
+
+            return self
+
+        for (field, field_type), padding_amount in zip(cls._fields_items, cls._padding_lengths(type_ctx=type_ctx)):
             value = field_type.unpack(buf, ctx=type_ctx)
             buf.read(padding_amount)
 
@@ -100,13 +118,14 @@ class AlignedPacket(Packet):
 
         type_ctx = self.type_ctx(ctx)
 
-        return b"".join(
-            field_type.pack(value, ctx=type_ctx) + b"\x00" * padding_amount
+        return b"".join([
+            field_type.pack(getattr(self, field), ctx=type_ctx) + b"\x00" * padding_amount
 
-            for (field_type, value), padding_amount in zip(self.field_types_and_values(), self._padding_lengths(type_ctx=type_ctx))
-        )
+            for (field, field_type), padding_amount in zip(self._fields_items, self._padding_lengths(type_ctx=type_ctx))
+        ])
 
     @util.class_or_instance_method
+    @util.cache
     def size(cls, *, ctx=None):
         """Overrides :meth:`.Packet.size` to handle alignment padding."""
 
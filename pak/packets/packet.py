@@ -1,12 +1,17 @@
 r"""Base code for :class:`~.Packet`\s."""
 
 import copy
+import functools
 import inspect
+import io
+import keyword
+import struct
 
 from .. import util
+from ..util.inspection import _is_specialized
 from ..dyn_value import DynamicValue
 from ..types.type import Type
-from ..types.misc import RawByte, EmptyType
+from ..types.misc import RawByte, EmptyType, StructType
 
 __all__ = [
     "ReservedFieldError",
@@ -208,6 +213,14 @@ class Packet:
     # for its fields, we define it here.
     _fields = {}
 
+    # Cached views of '_fields' so that hot paths
+    # iterate over tuples instead of the dict.
+    _fields_items = ()
+    _fields_names = ()
+
+    # The fields which are backed by read-only properties.
+    _read_only_fields = frozenset()
+
     # Will be replaced after 'Packet' is defined.
     class Header:
         pass
@@ -216,6 +229,10 @@ class Packet:
         "ctx",
     ]
 
+    # Used by the generated constructors to tell
+    # when a field was not passed as an argument.
+    _MISSING_FIELD = util.UniqueSentinel("MISSING_FIELD")
+
     @classmethod
     def id(cls, *, ctx=None):
         r"""Gets the ID of the :class:`Packet`.
@@ -273,15 +290,24 @@ class Packet:
 
     @classmethod
     def _init_id(cls):
-        # Don't do anything with the ID if it's already a classmethod.
-        if inspect.ismethod(cls.id):
+        # Get the ID the same way as 'inspect.getattr_static'
+        # would, but without the overhead of the general case.
+        id = next(base.__dict__["id"] for base in cls.__mro__ if "id" in base.__dict__)
+
+        # Don't do anything with the ID if it's already a classmethod,
+        # which is always the case if the ID is inherited from a packet.
+        if isinstance(id, classmethod):
             return
 
         # Transform normal values and dynamic values into a classmethod.
-        id = DynamicValue(inspect.getattr_static(cls, "id"))
+        id = DynamicValue(id)
 
         if isinstance(id, DynamicValue):
+            # Cache the dynamic ID since it only depends on the
+            # context, and it is looked up for each subclass when
+            # building the mapping of IDs to subclasses.
             @classmethod
+            @util.cache
             def real_id(cls, *, ctx=None):
                 """Gets the ID of the packet."""
 
@@ -302,8 +328,13 @@ class Packet:
     def _init_fields_from_annotations(cls):
         annotations = util.annotations(cls)
 
+        # Gather all the attributes up front so that checking
+        # for them doesn't need to walk the MRO for each field,
+        # nor invoke any descriptors like 'hasattr' would.
+        existing_attrs = set().union(*(vars(base) for base in cls.__mro__))
+
         cls._fields = {}
-        for base in cls.mro()[1:]:
+        for base in cls.__mro__[1:]:
             if not issubclass(base, Packet):
                 continue
 
@@ -327,7 +358,7 @@ class Packet:
             # Only add the Type descriptor
             # if there isn't already something
             # in its place (like a property).
-            if not hasattr(cls, attr):
+            if attr not in existing_attrs:
                 descriptor = real_type.descriptor()
 
                 # Set the name manually because '__set_name__'
@@ -337,18 +368,454 @@ class Packet:
 
                 setattr(cls, attr, descriptor)
 
+        cls._fields_items = tuple(cls._fields.items())
+        cls._fields_names = tuple(cls._fields)
+
+        read_only_fields = set()
+        for attr in cls._fields_names:
+            descriptor = cls._field_descriptor(attr)
+
+            if isinstance(descriptor, property) and descriptor.fset is None:
+                read_only_fields.add(attr)
+
+        cls._read_only_fields = frozenset(read_only_fields)
+
+    @classmethod
+    def _field_descriptor(cls, attr):
+        # Get the object which controls access to the field
+        # without invoking it, unlike 'getattr' would.
+        for base in cls.__mro__:
+            if attr in base.__dict__:
+                return base.__dict__[attr]
+
+        return None
+
+    @classmethod
+    def _specialize(cls, name, source, namespace):
+        # A method is only specialized if, ignoring the methods that were
+        # specialized for parent classes, the implementation that 'cls'
+        # would otherwise use is the generic one from 'Packet'. Anything
+        # else is an override (e.g. from 'AlignedPacket') which we must
+        # respect, even when it comes later in the MRO.
+
+        generic = Packet.__dict__[name]
+
+        impls = [base.__dict__[name] for base in cls.__mro__ if name in base.__dict__]
+        impl  = next(impl for impl in impls if not _is_specialized(impl))
+
+        if impl is not generic:
+            # Make sure that a method specialized for a parent
+            # class doesn't shadow the override.
+            if _is_specialized(impls[0]):
+                setattr(cls, name, impl)
+
+            return
+
+        code = compile(source, f"<{cls.__qualname__}.{name}>", "exec")
+        exec(code, namespace)
+
+        method = namespace[name]
+
+        # Keep the documentation and signature of the generic
+        # method, e.g. for 'help' and documentation generators.
+        if isinstance(generic, classmethod):
+            functools.update_wrapper(method, generic.__func__)
+        else:
+            functools.update_wrapper(method, generic)
+
+        method._specialized = True
+
+        if isinstance(generic, classmethod):
+            method = classmethod(method)
+
+        setattr(cls, name, method)
+
+    @classmethod
+    def _init_specialized_methods(cls):
+        # Generate methods which are specialized to the fields of the
+        # packet, so that hot paths like marshaling don't need to iterate
+        # over the fields and look up each 'Type' method on every call.
+
+        # Field names are used directly as attributes in the generated
+        # code, so bail out for anything which isn't a valid identifier.
+        if not all(attr.isidentifier() and not keyword.iskeyword(attr) for attr in cls._fields_names):
+            return
+
+        namespace = {
+            "_object_new":   object.__new__,
+            "_missing":      cls._MISSING_FIELD,
+            "_fields_items": cls._fields_items,
+        }
+
+        # The generated methods are only valid for the fields of 'cls',
+        # but may still be reached through 'super()' from a subclass
+        # which overrides them, in which case we defer to the next
+        # implementation in the MRO, so that e.g. mixins still apply.
+        namespace["_owner"] = cls
+
+        for i, (_, attr_type) in enumerate(cls._fields_items):
+            namespace[f"_pack_{i}"]        = attr_type.pack
+            namespace[f"_unpack_{i}"]      = attr_type.unpack
+            namespace[f"_unpack_from_{i}"] = attr_type.unpack_from
+            namespace[f"_default_{i}"]     = attr_type.default
+
+        def set_field(attr, value, indent):
+            # Setting a read-only field would fail, so it is skipped
+            # entirely. Fields with a 'Type' descriptor can always be
+            # set, and anything else may fail to be set, which is
+            # then ignored like in the generic implementations.
+
+            indent = " " * indent
+
+            if attr in cls._read_only_fields:
+                return ""
+
+            if isinstance(cls._field_descriptor(attr), Type):
+                return f"{indent}self.{attr} = {value}\n"
+
+            return (
+                f"{indent}try:\n"
+                f"{indent}    self.{attr} = {value}\n"
+                f"{indent}except AttributeError:\n"
+                f"{indent}    pass\n"
+            )
+
+        def init_field(i, attr):
+            # Explicitly passed values for read-only
+            # fields should still raise an error.
+            if attr in cls._read_only_fields:
+                return (
+                    f"    if {attr!r} in fields:\n"
+                    f"        self.{attr} = fields.pop({attr!r})\n"
+                )
+
+            return (
+                f"    value = fields.pop({attr!r}, _missing)\n"
+                 "    if value is _missing:\n"
+                 "        if type_ctx is None:\n"
+                 "            type_ctx = self.type_ctx(ctx)\n"
+                f"        value = _default_{i}(ctx=type_ctx)\n"
+                f"{set_field(attr, 'value', 8)}"
+                 "    else:\n"
+                f"        self.{attr} = value\n"
+            )
+
+        initialized_fields = "".join(init_field(i, attr) for i, attr in enumerate(cls._fields_names))
+
+        cls._specialize(
+            "__init__",
+
+            (
+                "def __init__(self, *, ctx=None, **fields):\n"
+                "    if self._fields_items is not _fields_items:\n"
+                "        return super(_owner, self).__init__(ctx=ctx, **fields)\n"
+                "    type_ctx = None\n"
+                f"{initialized_fields}"
+                "    if len(fields) > 0:\n"
+                "        raise TypeError(f\"Unexpected keyword arguments for '{type(self).__qualname__}': {fields}\")\n"
+            ),
+
+            namespace,
+        )
+
+        # Split the fields into runs of consecutive simple 'StructType's
+        # and fixed size 'RawByte' arrays, which can each be marshaled
+        # with a single 'struct.Struct'.
+        def fused_struct(run):
+            return StructType.fused_struct(*(cls._fields_items[i][1] for i in run), byte_arrays=True)
+
+        runs = []
+        for i in range(len(cls._fields_items)):
+            if len(runs) > 0 and runs[-1][-1] == i - 1 and fused_struct(runs[-1] + [i]) is not None:
+                runs[-1].append(i)
+
+                continue
+
+            if fused_struct([i]) is not None:
+                runs.append([i])
+
+        # Fusing a single field wouldn't save anything.
+        runs = [run for run in runs if len(run) > 1 or len(run) == len(cls._fields_items)]
+
+        namespace["_struct_error"] = struct.error
+        namespace["_bytes_io"]     = io.BytesIO
+        namespace["_bytearray"]    = bytearray
+
+        for k, run in enumerate(runs):
+            fused = fused_struct(run)
+
+            namespace[f"_run_pack_{k}"]        = fused.pack
+            namespace[f"_run_unpack_from_{k}"] = fused.unpack_from
+            namespace[f"_run_size_{k}"]        = fused.size
+
+        def assign_fields(run, indent):
+            # Assign all the unpacked values of a run at once, leaving
+            # out read-only fields and setting the fields which may
+            # fail to be set separately afterwards.
+
+            targets        = []
+            guarded_fields = ""
+            for i in run:
+                attr = cls._fields_names[i]
+
+                if attr in cls._read_only_fields:
+                    targets.append("_")
+
+                elif isinstance(cls._field_descriptor(attr), Type):
+                    targets.append(f"self.{attr}")
+
+                else:
+                    targets.append(f"value_{i}")
+
+                    # Byte strings are unpacked as 'bytes', but the
+                    # 'RawByte' arrays they replace give 'bytearray's.
+                    if issubclass(cls._fields_items[i][1], StructType):
+                        value = f"value_{i}"
+                    else:
+                        value = f"_bytearray(value_{i})"
+
+                    guarded_fields += set_field(attr, value, indent)
+
+            return f"{' ' * indent}{', '.join(targets)}, = values\n{guarded_fields}"
+
+        def unpack_run(k, run, indent, *, from_offset, init_type_ctx):
+            # Unpack the fields of a run with its combined struct.
+            #
+            # If the struct fails, e.g. from there not being enough
+            # data, then each field is unpacked on its own, so that
+            # the same errors are raised as would be otherwise.
+
+            pad = " " * indent
+
+            if from_offset:
+                source = (
+                    f"{pad}try:\n"
+                    f"{pad}    values = _run_unpack_from_{k}(buf, offset)\n"
+                )
+            else:
+                source = (
+                    f"{pad}data = buf.read(_run_size_{k})\n"
+                    f"{pad}try:\n"
+                    f"{pad}    values = _run_unpack_from_{k}(data)\n"
+                )
+
+            source += f"{pad}except _struct_error:\n"
+
+            if init_type_ctx:
+                source += f"{pad}    type_ctx = self.type_ctx(ctx)\n"
+
+            if not from_offset:
+                source += f"{pad}    data = _bytes_io(data)\n"
+
+            for i in run:
+                attr = cls._fields_names[i]
+
+                if from_offset:
+                    source += f"{pad}    value, offset = _unpack_from_{i}(buf, offset, ctx=type_ctx)\n"
+                else:
+                    source += f"{pad}    value = _unpack_{i}(data, ctx=type_ctx)\n"
+
+                source += set_field(attr, "value", indent + 4)
+
+            source += f"{pad}else:\n"
+
+            if from_offset:
+                source += f"{pad}    offset += _run_size_{k}\n"
+
+            return source + assign_fields(run, indent + 4)
+
+        if len(runs) == 1 and len(runs[0]) == len(cls._fields_items):
+            # Every field is a simple 'StructType', so the whole
+            # packet can be marshaled with a single 'struct.Struct'.
+            #
+            # Values which the combined struct can't handle fall
+            # back to packing each field, so that they are treated
+            # the same as they otherwise would be.
+            packed_fields = "".join(
+                f"_pack_{i}(self.{attr}, ctx=type_ctx), "
+
+                for i, attr in enumerate(cls._fields_names)
+            )
+
+            pack_source = (
+                "def pack_without_header(self, *, ctx=None):\n"
+                "    if self._fields_items is not _fields_items:\n"
+                "        return super(_owner, self).pack_without_header(ctx=ctx)\n"
+                "    try:\n"
+                f"        return _run_pack_0({', '.join(f'self.{attr}' for attr in cls._fields_names)})\n"
+                "    except _struct_error:\n"
+                "        pass\n"
+                "    type_ctx = self.type_ctx(ctx)\n"
+                f"    return b''.join(({packed_fields}))\n"
+            )
+
+            unpack_source = (
+                "def unpack(cls, buf, *, ctx=None):\n"
+                "    if cls._fields_items is not _fields_items:\n"
+                "        return super(_owner, cls).unpack(buf, ctx=ctx)\n"
+                "    self = _object_new(cls)\n"
+                "    if isinstance(buf, (bytes, bytearray)):\n"
+                "        offset = 0\n"
+                f"{unpack_run(0, runs[0], 8, from_offset=True, init_type_ctx=True)}"
+                "    else:\n"
+                f"{unpack_run(0, runs[0], 8, from_offset=False, init_type_ctx=True)}"
+                "    return self\n"
+            )
+
+        else:
+            run_starts = {run[0]: (k, run) for k, run in enumerate(runs)}
+
+            packed_runs   = ""
+            packed_fields = ""
+
+            # Fields before a run are packed ahead of it, so
+            # that fields are still packed in order and raise
+            # the same errors as they would otherwise.
+            pending_fields = []
+
+            unpacked_fields      = ""
+            unpacked_fields_from = ""
+
+            i = 0
+            while i < len(cls._fields_items):
+                if i in run_starts:
+                    k, run = run_starts[i]
+
+                    run_attrs  = ", ".join(f"self.{cls._fields_names[j]}" for j in run)
+                    run_packed = " + ".join(f"_pack_{j}(self.{cls._fields_names[j]}, ctx=type_ctx)" for j in run)
+
+                    for j in pending_fields:
+                        packed_runs += f"    field_{j} = _pack_{j}(self.{cls._fields_names[j]}, ctx=type_ctx)\n"
+
+                    packed_fields += "".join(f"field_{j}, " for j in pending_fields)
+
+                    pending_fields = []
+
+                    packed_runs += (
+                         "    try:\n"
+                        f"        run_{k} = _run_pack_{k}({run_attrs})\n"
+                         "    except _struct_error:\n"
+                        f"        run_{k} = {run_packed}\n"
+                    )
+
+                    packed_fields += f"run_{k}, "
+
+                    unpacked_fields      += unpack_run(k, run, 8, from_offset=False, init_type_ctx=False)
+                    unpacked_fields_from += unpack_run(k, run, 8, from_offset=True,  init_type_ctx=False)
+
+                    i = run[-1] + 1
+
+                    continue
+
+                attr = cls._fields_names[i]
+
+                pending_fields.append(i)
+
+                unpacked_fields += (
+                    f"        value = _unpack_{i}(buf, ctx=type_ctx)\n"
+                    f"{set_field(attr, 'value', 8)}"
+                )
+
+                unpacked_fields_from += (
+                    f"        value, offset = _unpack_from_{i}(buf, offset, ctx=type_ctx)\n"
+                    f"{set_field(attr, 'value', 8)}"
+                )
+
+                i += 1
+
+            # Fields after the last run can be packed in place.
+            packed_fields += "".join(f"_pack_{j}(self.{cls._fields_names[j]}, ctx=type_ctx), " for j in pending_fields)
+
+            unpacked_fields      = unpacked_fields      or "        pass\n"
+            unpacked_fields_from = unpacked_fields_from or "        pass\n"
+
+            pack_source = (
+                "def pack_without_header(self, *, ctx=None):\n"
+                "    if self._fields_items is not _fields_items:\n"
+                "        return super(_owner, self).pack_without_header(ctx=ctx)\n"
+                "    type_ctx = self.type_ctx(ctx)\n"
+                f"{packed_runs}"
+                f"    return b''.join(({packed_fields}))\n"
+            )
+
+            unpack_source = (
+                "def unpack(cls, buf, *, ctx=None):\n"
+                "    if cls._fields_items is not _fields_items:\n"
+                "        return super(_owner, cls).unpack(buf, ctx=ctx)\n"
+                "    self = _object_new(cls)\n"
+                "    type_ctx = self.type_ctx(ctx)\n"
+                "    if isinstance(buf, (bytes, bytearray)):\n"
+                "        buf = bytes(buf)\n"
+                "        offset = 0\n"
+                f"{unpacked_fields_from}"
+                "    else:\n"
+                f"{unpacked_fields}"
+                "    return self\n"
+            )
+
+        cls._specialize("pack_without_header", pack_source, namespace)
+        cls._specialize("unpack", unpack_source, namespace)
+
+        compared_fields = "".join(
+            f"    if not (self.{attr} == other.{attr}):\n"
+             "        return False\n"
+
+            for attr in cls._fields_names
+        )
+
+        cls._specialize(
+            "__eq__",
+
+            (
+                "def __eq__(self, other):\n"
+                "    if self._fields_items is not _fields_items:\n"
+                "        return super(_owner, self).__eq__(other)\n"
+                "    if type(other) is not type(self) and self._fields != other._fields:\n"
+                "        return False\n"
+                f"{compared_fields}"
+                "    return True\n"
+            ),
+
+            namespace,
+        )
+
+        # NOTE: The name is looked up on each call since it may be
+        # changed after the class is created, e.g. for 'Packet.Header'.
+        repr_fields = ", ".join(f"{attr}={{self.{attr}!r}}" for attr in cls._fields_names)
+
+        cls._specialize(
+            "__repr__",
+
+            (
+                "def __repr__(self):\n"
+                "    if self._fields_items is not _fields_items:\n"
+                "        return super(_owner, self).__repr__()\n"
+                f"    return f'{{type(self).__qualname__}}({repr_fields})'\n"
+            ),
+
+            namespace,
+        )
+
     @classmethod
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
 
         cls._init_id()
         cls._init_fields_from_annotations()
-
+        cls._init_specialized_methods()
+
+    # NOTE: We do not generate '__slots__' for the fields of packets.
+    # Fields from multiple parents would lead to conflicting instance
+    # layouts, which would break inheriting from multiple packets, and
+    # packets commonly store extra attributes on themselves, e.g. the
+    # backing values of properties. Furthermore, '__slots__' only takes
+    # effect if present when the class is created, so they could not be
+    # added from '__init_subclass__', which runs after the fact.
     def __init__(self, *, ctx=None, **fields):
         # Lazy initialized when needed.
         type_ctx = None
 
-        for attr, attr_type in self.enumerate_field_types():
+        for attr, attr_type in self._fields_items:
             if attr in fields:
                 setattr(self, attr, fields.pop(attr))
             else:
@@ -437,10 +904,31 @@ class Packet:
 
         self = object.__new__(cls)
 
-        buf = util.file_object(buf)
-
         type_ctx = self.type_ctx(ctx)
-        for attr, attr_type in cls.enumerate_field_types():
+
+        # When given raw data, unpack directly from it by threading
+        # an offset through the fields instead of using a file object.
+        if isinstance(buf, (bytes, bytearray)):
+            # Convert to 'bytes' once so that types which
+            # fall back to a file object don't copy the data.
+            buf    = bytes(buf)
+            offset = 0
+
+            for attr, attr_type in cls._fields_items:
+                value, offset = attr_type.unpack_from(buf, offset, ctx=type_ctx)
+
+                try:
+                    setattr(self, attr, value)
+
+                except AttributeError:
+                    # If trying to set an unpacked value fails
+                    # (like if the attribute is read-only)
+                    # then just move on.
+                    pass
+
+            return self
+
+        for attr, attr_type in cls._fields_items:
             value = attr_type.unpack(buf, ctx=type_ctx)
 
             try:
@@ -483,10 +971,10 @@ class Packet:
 
         type_ctx = self.type_ctx(ctx)
 
-        return b"".join(
-            attr_type.pack(value, ctx=type_ctx)
-            for attr_type, value in self.field_types_and_values()
-        )
+        return b"".join([
+            attr_type.pack(getattr(self, attr), ctx=type_ctx)
+            for attr, attr_type in self._fields_items
+        ])
 
     def pack(self, *, ctx=None):
         r"""Packs a :class:`Packet` to raw data.
@@ -522,6 +1010,16 @@ class Packet:
         b'\xff\x04\x00\x01\x02\x03'
         """
 
+        # Default construct the context only once
+        # instead of for both the header and the body.
+        if ctx is None:
+            ctx = self.Context()
+
+        # The default header has no fields and so
+        # would always pack to empty bytes.
+        if self.Header is Packet.Header:
+            return self.pack_without_header(ctx=ctx)
+
         packed_header = self.header(ctx=ctx).pack(ctx=ctx)
 
         return packed_header + self.pack_without_header(ctx=ctx)
@@ -601,7 +1099,7 @@ class Packet:
         attr2
         """
 
-        return cls._fields.keys()
+        return cls._fields_names
 
     @classmethod
     def field_types(cls):
@@ -651,7 +1149,7 @@ class Packet:
         2
         """
 
-        for field in self.field_names():
+        for field in self._fields_names:
             yield getattr(self, field)
 
     def field_types_and_values(self):
@@ -677,7 +1175,7 @@ class Packet:
         Int16; 2
         """
 
-        for field, type in self.enumerate_field_types():
+        for field, type in self._fields_items:
             yield type, getattr(self, field)
 
     @classmethod
@@ -703,7 +1201,7 @@ class Packet:
         attr2: Int16
         """
 
-        return cls._fields.items()
+        return cls._fields_items
 
     def enumerate_field_values(self):
         """Enumerates the values of the fields of the :class:`Packet`.
@@ -728,7 +1226,7 @@ class Packet:
         attr2: 2
         """
 
-        for attr in self._fields:
+        for attr in self._fields_names:
             yield attr, getattr(self, attr)
 
     def enumerate_field_types_and_values(self):
@@ -754,10 +1252,11 @@ class Packet:
         attr2: Int16; 2
         """
 
-        for attr, attr_type in self.enumerate_field_types():
+        for attr, attr_type in self._fields_items:
             yield attr, attr_type, getattr(self, attr)
 
     @util.class_or_instance_method
+    @util.cache
     def size(cls, *, ctx=None):
         """Gets the cumulative size of the fields of the :class:`Packet`.
 
@@ -794,12 +1293,16 @@ class Packet:
         12
         """
 
+        # NOTE: The static size of a 'Packet' only depends on its
+        # class and its context, both of which are hashable, so
+        # we cache it to avoid summing over the fields each call.
+
         if ctx is None:
             ctx = cls.Context()
 
         type_ctx = Type.Context(ctx=ctx)
 
-        return sum(field_type.size(ctx=type_ctx) for field_type in cls.field_types())
+        return sum(field_type.size(ctx=type_ctx) for _, field_type in cls._fields_items)
 
     @size.instance_method
     def size(self, *, ctx=None):
@@ -868,24 +1371,35 @@ class Packet:
         if ctx is None:
             ctx = cls.Context()
 
+        return cls._subclasses_by_id(ctx=ctx).get(id)
+
+    @classmethod
+    @util.cache
+    def _subclasses_by_id(cls, *, ctx):
+        # Map the IDs of the subclasses to the subclasses
+        # themselves so that lookups don't need to scan
+        # through every subclass for each new ID.
+
+        subclasses_by_id = {}
         for subclass in cls.subclasses():
             subclass_id = subclass.id(ctx=ctx)
-            if subclass_id is not None and subclass_id == id:
-                return subclass
+            if subclass_id is not None:
+                subclasses_by_id.setdefault(subclass_id, subclass)
 
-        return None
+        return subclasses_by_id
 
     def __eq__(self, other):
         # ID and header are not included in equality.
 
-        if self._fields != other._fields:
+        # Packets of the same type necessarily have the same fields.
+        if type(other) is not type(self) and self._fields != other._fields:
             return False
 
-        return all(
-            value == other_value
-            for value, other_value in
-            zip(self.field_values(), other.field_values())
-        )
+        for attr in self._fields_names:
+            if not (getattr(self, attr) == getattr(other, attr)):
+                return False
+
+        return True
 
     # NOTE: We do not implement '__hash__' since Packets are not immutable.
     # Technically mutability is contextual and not a fact of a type.
@@ -59,14 +59,26 @@ def type_behavior(type_cls, *values_and_data, static_size, alignment=None, defau
     ... )
     """
 
+    # Look up the methods once instead of for every value.
+    pack        = type_cls.pack
+    unpack      = type_cls.unpack
+    unpack_from = type_cls.unpack_from
+    size        = type_cls.size
+
     for value, data in values_and_data:
-        data_from_value = type_cls.pack(value, ctx=ctx)
-        value_from_data = type_cls.unpack(data, ctx=ctx)
+        data_from_value = pack(value, ctx=ctx)
+        value_from_data = unpack(data, ctx=ctx)
 
         assert data_from_value == data,  f"data_from_value={data_from_value}; data={data}; value={value}"
         assert value_from_data == value, f"value_from_data={value_from_data}; value={value}; data={data}"
 
-        size_from_value = type_cls.size(value, ctx=ctx)
+        # Make sure unpacking at an offset gives the same value.
+        value_from_offset, offset = unpack_from(b"\x00" + data, 1, ctx=ctx)
+
+        assert value_from_offset == value,         f"value_from_offset={value_from_offset}; value={value}; data={data}"
+        assert offset            == len(data) + 1, f"offset={offset}; data={data}; value={value}"
+
+        size_from_value = size(value, ctx=ctx)
         assert size_from_value == len(data), f"size_from_value={size_from_value}; data={data}; value={value}"
 
     if static_size is None:
@@ -166,12 +178,19 @@ def packet_behavior(*packets_and_data, ctx=None):
 
         assert header_from_packet == header_from_data, f"data={data}, packet={packet}"
 
+        header_end = data_file.tell()
+
         data_from_packet = packet.pack(ctx=ctx)
         packet_from_data = packet.unpack(data_file, ctx=ctx)
 
         assert data_from_packet == data,   f"data_from_packet={data_from_packet}; data={data}; packet={packet}"
         assert packet_from_data == packet, f"packet_from_data={packet_from_data}; packet={packet}; data={data}"
 
+        # Make sure unpacking directly from the raw data gives the same packet.
+        packet_from_raw = packet.unpack(data[header_end:], ctx=ctx)
+
+        assert packet_from_raw == packet, f"packet_from_raw={packet_from_raw}; packet={packet}; data={data}"
+
 def packet_behavior_func(*args, **kwargs):
     r"""Generates a function that calls :func:`packet_behavior`.
 
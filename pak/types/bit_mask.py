@@ -87,7 +87,9 @@ class BitMask(Type):
 
             elems.append(value)
 
-        return cls.value_type(*elems)
+        # The number of elements is known to be correct,
+        # so skip the Python-level '__new__' of the value type.
+        return tuple.__new__(cls.value_type, elems)
 
     @classmethod
     def _pack(cls, value, *, ctx):
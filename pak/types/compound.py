@@ -1,9 +1,12 @@
 r""":class:`~.Type`\s for combining :class:`~.Type`\s."""
 
+import collections.abc
+import struct
 from collections import namedtuple
 
 from .. import util
 from .type import Type
+from .misc import StructType
 
 __all__ = [
     "Compound",
@@ -70,19 +73,68 @@ class Compound(Type):
             t.size(v, ctx=ctx) for v, t in zip(value, cls.types())
         )
 
+    # NOTE: The value type is constructed directly with 'tuple.__new__'
+    # when the number of values is known to be correct, skipping the
+    # Python-level '__new__' generated by 'collections.namedtuple'.
+
     @classmethod
     def _default(cls, *, ctx):
-        return cls.value_type(*(t.default(ctx=ctx) for t in cls.types()))
+        return tuple.__new__(cls.value_type, [t.default(ctx=ctx) for t in cls.types()])
 
     @classmethod
     def _unpack(cls, buf, *, ctx):
-        return cls.value_type(*(t.unpack(buf, ctx=ctx) for t in cls.types()))
+        return tuple.__new__(cls.value_type, [t.unpack(buf, ctx=ctx) for t in cls.types()])
 
     @classmethod
     def _pack(cls, value, *, ctx):
-        return b"".join(
+        return b"".join([
             t.pack(v, ctx=ctx) for v, t in zip(value, cls.types())
-        )
+        ])
+
+    @classmethod
+    def _fused_struct(cls):
+        # Subclasses may marshal their values differently,
+        # in which case they can't use a combined struct.
+        if cls._pack.__func__ is not Compound._pack.__func__ or cls._unpack.__func__ is not Compound._unpack.__func__:
+            return None
+
+        return StructType.fused_struct(*cls.types())
+
+    @classmethod
+    def _array_unpack(cls, buf, size, *, ctx):
+        fused = cls._fused_struct()
+        if fused is None or size is None:
+            return super()._array_unpack(buf, size, ctx=ctx)
+
+        # A negative size, e.g. from a signed length,
+        # must not read the rest of the data.
+        if size <= 0:
+            return []
+
+        # Unpack every element with a single struct,
+        # avoiding unpacking each field of each element.
+        return [
+            tuple.__new__(cls.value_type, values)
+
+            for values in fused.iter_unpack(buf.read(fused.size * size))
+        ]
+
+    @classmethod
+    def _array_pack(cls, value, size, *, ctx):
+        # NOTE: Only sized values are packed with the combined
+        # struct so that values such as generators are not
+        # consumed before falling back to the generic path.
+        fused = cls._fused_struct()
+        if fused is not None and isinstance(value, collections.abc.Sized) and len(value) == size:
+            try:
+                return b"".join([fused.pack(*x) for x in value])
+
+            except (struct.error, TypeError):
+                # Let each field handle values that
+                # the combined struct can't handle.
+                pass
+
+        return super()._array_pack(value, size, ctx=ctx)
 
     @classmethod
     @Type.prepare_types
@@ -151,12 +203,12 @@ class AlignedCompound(Compound):
             values.append(t.unpack(buf, ctx=ctx))
             buf.read(padding_amount)
 
-        return cls.value_type(*values)
+        return tuple.__new__(cls.value_type, values)
 
     @classmethod
     def _pack(cls, value, *, ctx):
-        return b"".join(
+        return b"".join([
             t.pack(v, ctx=ctx) + b"\x00" * padding_amount
 
             for v, t, padding_amount in zip(value, cls.types(), cls._padding_lengths(ctx=ctx))
-        )
+        ])
@@ -1,6 +1,9 @@
 r"""Enumeration :class:`~.Type`\s."""
 
+import enum
+
 from .. import util
+from ..util.inspection import _is_specialized
 from .type import Type
 
 __all__ = [
@@ -78,6 +81,121 @@ class Enum(Type):
     #   then your pak specification should simply be updated accordingly.
     INVALID = util.UniqueSentinel("INVALID")
 
+    # A mapping of values to members of the enum, used to avoid
+    # looking up members through the enum itself when unpacking.
+    #
+    # If 'None', then the members must be looked up through the enum.
+    _value_map = None
+
+    @classmethod
+    def __init_subclass__(cls, **kwargs):
+        # Get the first member of the enum type as the default
+        # once, before 'Type.__init_subclass__' processes it.
+        #
+        # This is only done when the default has not been
+        # customized, i.e. when it is either the generic one or
+        # was itself set to the first member of an enum type.
+        if cls.enum_type is not None:
+            owner = next(base for base in cls.__mro__ if "_default" in base.__dict__)
+
+            if owner is Type or owner.__dict__.get("_first_member_default", False):
+                cls._default              = next(iter(cls.enum_type.__members__.values()), None)
+                cls._first_member_default = True
+
+        super().__init_subclass__(**kwargs)
+
+        cls._init_value_map()
+        cls._init_specialized_marshal()
+
+    @classmethod
+    def _init_value_map(cls):
+        cls._value_map = None
+
+        if cls.enum_type is None:
+            return
+
+        # Enums which customize looking up their members
+        # may have members that aren't in such a mapping.
+        if cls.enum_type._missing_.__func__ is not enum.Enum._missing_.__func__:
+            return
+
+        try:
+            cls._value_map = {member.value: member for member in cls.enum_type.__members__.values()}
+
+        except TypeError:
+            # Unhashable values need to be looked up through the enum.
+            pass
+
+    @classmethod
+    def _init_specialized_marshal(cls):
+        # Replace '_pack', '_unpack', and '_unpack_from' with closures
+        # which capture the element type's methods and the value map,
+        # so that marshaling doesn't need to look them up on every call.
+        #
+        # This is only done when the methods that would otherwise
+        # be used, ignoring those specialized for parent classes,
+        # are the generic ones.
+
+        generics = {
+            "_pack":        Enum.__dict__["_pack"],
+            "_unpack":      Enum.__dict__["_unpack"],
+            "_unpack_from": Type.__dict__["_unpack_from"],
+        }
+
+        impls = {}
+        for name in generics.keys():
+            impls[name] = next(
+                base.__dict__[name]
+
+                for base in cls.__mro__
+
+                if name in base.__dict__ and not _is_specialized(base.__dict__[name])
+            )
+
+        if cls._value_map is None or cls.elem_type is None or any(impls[name] is not generic for name, generic in generics.items()):
+            # Make sure that methods specialized for a
+            # parent class don't apply to this class.
+            for name, impl in impls.items():
+                if _is_specialized(cls._static_attr(name)):
+                    setattr(cls, name, impl)
+
+            return
+
+        value_map_get    = cls._value_map.get
+        invalid          = cls.INVALID
+        elem_pack        = cls.elem_type.pack
+        elem_unpack      = cls.elem_type.unpack
+        elem_unpack_from = cls.elem_type.unpack_from
+
+        def _pack(cls, value, *, ctx):
+            if value is invalid:
+                raise ValueError(f"Cannot pack invalid value for {cls.__qualname__}")
+
+            return elem_pack(value.value, ctx=ctx)
+
+        def _unpack(cls, buf, *, ctx):
+            value = elem_unpack(buf, ctx=ctx)
+
+            try:
+                return value_map_get(value, invalid)
+
+            except TypeError:
+                return invalid
+
+        def _unpack_from(cls, buf, offset, *, ctx):
+            value, offset = elem_unpack_from(buf, offset, ctx=ctx)
+
+            try:
+                return value_map_get(value, invalid), offset
+
+            except TypeError:
+                return invalid, offset
+
+        for method in (_pack, _unpack, _unpack_from):
+            method._specialized = True
+
+            setattr(cls, method.__name__, classmethod(method))
+
     @classmethod
     def _size(cls, value, *, ctx):
         if value is cls.STATIC_SIZE or value is cls.INVALID:
@@ -85,20 +203,24 @@ class Enum(Type):
 
         return cls.elem_type.size(value.value, ctx=ctx)
 
-    @classmethod
-    def _default(cls, *, ctx):
-        # Get the first member of the enum type.
-        return next(iter(cls.enum_type.__members__.values()))
-
     @classmethod
     def _unpack(cls, buf, *, ctx):
-            value = cls.elem_type.unpack(buf, ctx=ctx)
+        value = cls.elem_type.unpack(buf, ctx=ctx)
 
+        if cls._value_map is not None:
             try:
-                return cls.enum_type(value)
-            except ValueError:
+                return cls._value_map.get(value, cls.INVALID)
+
+            except TypeError:
+                # An unhashable value can't be equal
+                # to the hashable values of the enum.
                 return cls.INVALID
 
+        try:
+            return cls.enum_type(value)
+        except ValueError:
+            return cls.INVALID
+
     @classmethod
     def _pack(cls, value, *, ctx):
         if value is cls.INVALID:
@@ -4,6 +4,7 @@ import struct
 
 from .. import util
 from .type import Type
+from .array import Array
 
 __all__ = [
     "EmptyType",
@@ -45,6 +46,10 @@ class EmptyType(Type):
     def _unpack(cls, buf, *, ctx):
         return None
 
+    @classmethod
+    def _unpack_from(cls, buf, offset, *, ctx):
+        return None, offset
+
     @classmethod
     def _pack(cls, value, *, ctx):
         return b""
@@ -86,6 +91,13 @@ class Padding(Type):
 
         return None
 
+    @classmethod
+    def _unpack_from(cls, buf, offset, *, ctx):
+        if len(buf) - offset < 1:
+            raise util.BufferOutOfDataError("Reading padding failed")
+
+        return None, offset + 1
+
     @classmethod
     def _pack(cls, value, *, ctx):
         return b"\x00"
@@ -101,6 +113,11 @@ class Padding(Type):
 
             return None
 
+        # A negative size, e.g. from a signed length,
+        # must not read the rest of the data.
+        if size <= 0:
+            return None
+
         data = buf.read(size)
         if len(data) < size:
             raise util.BufferOutOfDataError("Reading padding failed")
@@ -140,6 +157,15 @@ class RawByte(Type):
 
         return byte
 
+    @classmethod
+    def _unpack_from(cls, buf, offset, *, ctx):
+        byte = bytes(buf[offset:offset + 1])
+
+        if len(byte) < 1:
+            raise util.BufferOutOfDataError("Reading byte failed")
+
+        return byte, offset + 1
+
     @classmethod
     def _pack(cls, value, *, ctx):
         return bytes(value[:1])
@@ -153,6 +179,21 @@ class RawByte(Type):
         if size is None:
             return bytearray(buf.read())
 
+        # A negative size, e.g. from a signed length,
+        # must not read the rest of the data.
+        if size <= 0:
+            return bytearray()
+
+        # Read straight into the resulting 'bytearray' when
+        # possible, to avoid copying the data read a second time.
+        readinto = getattr(buf, "readinto", None)
+        if readinto is not None:
+            data = bytearray(size)
+            if readinto(data) < size:
+                raise util.BufferOutOfDataError("Reading data failed")
+
+            return data
+
         data = buf.read(size)
         if len(data) < size:
             raise util.BufferOutOfDataError("Reading data failed")
@@ -186,15 +227,68 @@ class StructType(Type):
     fmt    = None
     endian = "<"
 
+    _fusable = False
+
     @classmethod
     def __init_subclass__(cls, **kwargs):
-        super().__init_subclass__(**kwargs)
-
         # Compile a struct.Struct on class initialization.
+        #
+        # This is done before calling 'Type.__init_subclass__'
+        # so that the size is set when it gets processed there.
         if cls.fmt is not None:
             cls._struct = struct.Struct(f"{cls.endian}{cls.fmt}")
             cls._size   = cls._struct.size
 
+        super().__init_subclass__(**kwargs)
+
+        cls._init_fast_marshal()
+
+    @classmethod
+    def _init_fast_marshal(cls):
+        # For simple 'StructType's, replace 'pack' and 'unpack'
+        # with versions which go straight to the 'struct.Struct',
+        # skipping the context and file object handling they
+        # have no use for.
+
+        # Cache whether the 'StructType' is fusable
+        # for the bulk marshaling of arrays.
+        cls._fusable = cls._is_fusable()
+
+        if not cls._fusable:
+            # Make sure a subclass doesn't inherit a
+            # fast path which no longer applies to it.
+            if "pack" not in cls.__dict__:
+                cls.pack = Type.__dict__["pack"]
+
+            if "unpack" not in cls.__dict__:
+                cls.unpack = Type.__dict__["unpack"]
+
+            return
+
+        struct_pack        = cls._struct.pack
+        struct_unpack      = cls._struct.unpack
+        struct_unpack_from = cls._struct.unpack_from
+        struct_size        = cls._struct.size
+
+        generic_pack = Type.__dict__["pack"].__func__
+
+        def pack(cls, value, *, ctx=None):
+            try:
+                return struct_pack(value)
+
+            except struct.error:
+                # Let the generic path handle e.g. iterable values.
+                return generic_pack(cls, value, ctx=ctx)
+
+        def unpack(cls, buf, *, ctx=None):
+            if isinstance(buf, (bytes, bytearray)):
+                return struct_unpack_from(buf)[0]
+
+            return struct_unpack(buf.read(struct_size))[0]
+
+        cls.pack   = classmethod(pack)
+        cls.unpack = classmethod(unpack)
+
     @classmethod
     def _unpack(cls, buf, *, ctx):
         ret = cls._struct.unpack(buf.read(cls._struct.size))
@@ -204,9 +298,169 @@ class StructType(Type):
 
         return ret
 
+    @classmethod
+    def _unpack_from(cls, buf, offset, *, ctx):
+        ret = cls._struct.unpack_from(buf, offset)
+
+        if len(ret) == 1:
+            ret = ret[0]
+
+        return ret, offset + cls._struct.size
+
     @classmethod
     def _pack(cls, value, *, ctx):
         if util.is_iterable(value):
             return cls._struct.pack(*value)
 
         return cls._struct.pack(value)
+
+    @classmethod
+    def _array_unpack(cls, buf, size, *, ctx):
+        if not cls._fusable:
+            return super()._array_unpack(buf, size, ctx=ctx)
+
+        if size is None:
+            data = buf.read()
+
+            # Ignore any trailing data too short for another element.
+            data = data[:len(data) - len(data) % cls._struct.size]
+
+            return [x for x, in cls._struct.iter_unpack(data)]
+
+        # A negative size, e.g. from a signed length,
+        # would otherwise give an invalid format.
+        if size <= 0:
+            return []
+
+        # Unpack every element with a single struct
+        # instead of unpacking each element on its own.
+        return list(struct.unpack(f"{cls.endian}{size}{cls.fmt}", buf.read(cls._struct.size * size)))
+
+    @classmethod
+    def _array_pack(cls, value, size, *, ctx):
+        # NOTE: The length is checked first so that values
+        # which are not sized, such as generators, are not
+        # consumed before falling back to the generic path.
+        if cls._fusable:
+            try:
+                if len(value) == size:
+                    return struct.pack(f"{cls.endian}{size}{cls.fmt}", *value)
+
+            except (struct.error, TypeError):
+                # Let each element be handled on its own
+                # for values the struct can't handle.
+                pass
+
+        return super()._array_pack(value, size, ctx=ctx)
+
+    @classmethod
+    def _is_fusable(cls):
+        # Whether the values of the 'StructType' can be marshaled
+        # as part of a larger, combined 'struct.Struct'.
+
+        if cls.fmt is None:
+            return False
+
+        # The '?' format accepts any object, so it would never fail
+        # for iterable values, which must be unpacked into it instead.
+        if "?" in cls.fmt:
+            return False
+
+        # Native alignment would add padding between combined formats.
+        if cls.endian in ("", "@"):
+            return False
+
+        for method in ("_pack", "_unpack", "_unpack_from"):
+            if getattr(cls, method).__func__ is not getattr(StructType, method).__func__:
+                return False
+
+        # Only formats for a single value can be
+        # combined, since others unpack to tuples.
+        return len(cls._struct.unpack(bytes(cls._struct.size))) == 1
+
+    @staticmethod
+    @util.cache
+    def fused_struct(*types, byte_arrays=False):
+        r"""Gets a :class:`struct.Struct` which marshals several :class:`StructType`\s at once.
+
+        Should rarely be used by users. It is used
+        internally to marshal runs of simple fields
+        without going through each :class:`StructType`.
+
+        Parameters
+        ----------
+        *types : subclass of :class:`Type`
+            The :class:`Type`\s to combine.
+        byte_arrays : :class:`bool`
+            Whether fixed size :class:`~.Array`\s of :class:`RawByte`
+            may be combined as well, as byte strings.
+
+            Note that byte strings are unpacked as :class:`bytes`
+            and not as :class:`bytearray` like the :class:`~.Array`\s
+            themselves would.
+
+        Returns
+        -------
+        :class:`struct.Struct` or ``None``
+            If ``None``, then ``types`` could not be combined. Otherwise
+            the :class:`struct.Struct` which marshals a value for each
+            of ``types``, as each :class:`StructType` would on its own.
+
+        Examples
+        --------
+        >>> import pak
+        >>> fused = pak.StructType.fused_struct(pak.Int8, pak.UInt16)
+        >>> fused.format
+        '<bH'
+        >>> fused.pack(1, 2)
+        b'\x01\x02\x00'
+        >>> pak.StructType.fused_struct(pak.Int8, pak.ULEB128) is None
+        True
+        >>> pak.StructType.fused_struct(pak.Int8, pak.RawByte[2], byte_arrays=True).format
+        '<b2s'
+        """
+
+        if len(types) == 0:
+            return None
+
+        endian = None
+        fmts   = []
+        for t in types:
+            if not isinstance(t, type):
+                return None
+
+            if issubclass(t, StructType) and t._is_fusable():
+                if endian is None:
+                    endian = t.endian
+
+                elif t.endian != endian:
+                    return None
+
+                fmts.append(t.fmt)
+
+            elif byte_arrays and StructType._is_fusable_byte_array(t):
+                fmts.append(f"{t.array_size}s")
+
+            else:
+                return None
+
+        # Byte strings have no endianness.
+        if endian is None:
+            endian = StructType.endian
+
+        return struct.Struct(endian + "".join(fmts))
+
+    @staticmethod
+    def _is_fusable_byte_array(type_cls):
+        # Whether 'type_cls' is a fixed size 'RawByte' array, which
+        # can be marshaled as a byte string in a combined struct.
+
+        return (
+            issubclass(type_cls, Array) and
+
+            type_cls.elem_type is RawByte and
+            type_cls.is_fixed_size()      and
+
+            type_cls._pack.__func__   is Array._pack.__func__ and
+            type_cls._unpack.__func__ is Array._unpack.__func__
+        )
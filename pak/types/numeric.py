@@ -1,5 +1,7 @@
 r""":class:`~.Type`\s for numbers."""
 
+import struct
+
 from .. import util
 from .type import Type
 from .misc import StructType
@@ -44,6 +46,41 @@ class UInt8(StructType):
 
     fmt = "B"
 
+    @classmethod
+    def _array_unpack(cls, buf, size, *, ctx):
+        if not cls._fusable:
+            return super()._array_unpack(buf, size, ctx=ctx)
+
+        # Each byte of the data is already an element.
+
+        if size is None:
+            return list(buf.read())
+
+        # A negative size, e.g. from a signed length,
+        # must not read the rest of the data.
+        if size <= 0:
+            return []
+
+        data = buf.read(size)
+        if len(data) < size:
+            raise struct.error(f"unpack requires a buffer of {size} bytes")
+
+        return list(data)
+
+    @classmethod
+    def _array_pack(cls, value, size, *, ctx):
+        if cls._fusable:
+            try:
+                if len(value) == size:
+                    return bytes(value)
+
+            except (ValueError, TypeError):
+                # Let the struct handle values
+                # 'bytes' can't convert.
+                pass
+
+        return super()._array_pack(value, size, ctx=ctx)
+
 class Int16(StructType):
     """A signed 16-bit integer."""
 
@@ -1,9 +1,10 @@
 r"""Base code for :class:`~.Type`\s."""
 
-import abc
 import inspect
 import copy
+import enum
 import functools
+import io
 
 from .. import util
 from ..dyn_value import DynamicValue
@@ -25,7 +26,22 @@ class NoStaticSizeError(Exception):
     def __init__(self, type_cls):
         super().__init__(f"'{type_cls.__qualname__}' has no static size")
 
-class Type(abc.ABC):
+def _is_immutable(value):
+    # Whether 'value' is definitely immutable, and
+    # so can be shared without being copied.
+
+    # Enum members are singletons which are never copied anyways.
+    if isinstance(value, enum.Enum):
+        return True
+
+    value_type = type(value)
+
+    if value_type in (tuple, frozenset):
+        return all(_is_immutable(x) for x in value)
+
+    return value_type in (int, float, bool, complex, str, bytes, type(None))
+
+class Type:
     r"""A definition of how to marshal raw data to and from values.
 
     Typically used for the types of :class:`~.Packet` fields.
@@ -99,48 +115,129 @@ class Type(abc.ABC):
             :class:`Type.Context` will be gotten from this.
         """
 
+        # NOTE: '__slots__' is used so that looking up 'packet'
+        # and 'packet_ctx' never goes through '__getattr__', and
+        # so that each context is smaller.
+        __slots__ = ("packet", "packet_ctx")
+
+        # The shared empty context, set after 'Type' is created.
+        _empty = None
+
+        def __new__(cls, packet=None, *, ctx=None):
+            # Since contexts are immutable, an empty context
+            # can be shared instead of constructing a new one.
+            if packet is None and ctx is None and cls is Type.Context and cls._empty is not None:
+                return cls._empty
+
+            return super().__new__(cls)
+
         def __init__(self, packet=None, *, ctx=None):
-            self.packet     = packet
-            self.packet_ctx = ctx
+            # Go through 'object.__setattr__' since
+            # our own '__setattr__' always raises.
+            object.__setattr__(self, "packet",     packet)
+            object.__setattr__(self, "packet_ctx", ctx)
 
         def __getattr__(self, attr):
-            if attr in ("packet", "packet_ctx"):
-                return super().__getattr__(attr)
+            # Only called when normal attribute lookup fails,
+            # so attributes are forwarded to the packet context.
+
+            # NOTE: The errors are kept cheap to construct since
+            # missing attributes are commonly probed for, e.g.
+            # by 'hasattr' and when copying.
 
-            if self.packet_ctx is None:
-                raise AttributeError(f"'{type(self).__qualname__}' object has no attribute '{attr}'")
+            if attr in self.__slots__:
+                raise AttributeError(attr)
 
-            return getattr(self.packet_ctx, attr)
+            packet_ctx = self.packet_ctx
+            if packet_ctx is None:
+                raise AttributeError(attr)
+
+            return getattr(packet_ctx, attr)
 
         def __setattr__(self, attr, value):
-            if hasattr(self, "packet_ctx"):
-                raise TypeError(f"'{type(self).__qualname__}' is immutable")
+            raise TypeError(f"'{type(self).__qualname__}' is immutable")
+
+        def __reduce__(self):
+            # Reconstruct through '__init__' when copying or
+            # pickling, since '__setattr__' always raises.
+            return (functools.partial(type(self), ctx=self.packet_ctx), (self.packet,))
+
+        def cache_key(self):
+            r"""Gets a hashable key for the :class:`Type.Context`.
+
+            :class:`Type.Context`\s with equal keys are equal, and so
+            this may be used to cache values which depend on the context.
+
+            Since the packet of a :class:`Type.Context` may be mutated,
+            a :class:`Type.Context` with a packet only has an equal key
+            to itself. Otherwise, the key depends on the packet context.
+
+            Returns
+            -------
+            :class:`tuple`
+                The key for the :class:`Type.Context`.
+            """
 
-            super().__setattr__(attr, value)
+            # This should be perfectly safe since as long as the
+            # key is used, the type context should be referenced
+            # and so should not be garbage collected.
+            if self.packet is not None:
+                return (id(self), self.packet_ctx)
+
+            return (None, self.packet_ctx)
 
         def __hash__(self):
-            # Since Packets are not hashable, hash the identity of it.
-            # This should be perfectly safe since as long as the type
-            # context holds a reference to the packet, it should not be
-            # garbage collected.
-            return hash((id(self.packet), self.packet_ctx))
+            return hash(self.cache_key())
+
+        def __eq__(self, other):
+            # Contexts without a packet are equal if their packet
+            # contexts are, so that e.g. cached sizes may be reused.
+
+            if not isinstance(other, Type.Context):
+                return NotImplemented
+
+            if self is other:
+                return True
+
+            return self.packet is None and other.packet is None and self.packet_ctx == other.packet_ctx
 
     _typelikes = {}
 
+    _make_type_cache = {}
+
     _size      = None
     _alignment = None
     _default   = None
 
+    _default_immutable = False
+
     def __new__(cls, typelike):
         if isinstance(typelike, type) and issubclass(typelike, Type):
             return typelike
 
-        for typelike_cls, converter in cls._typelikes.items():
-            if isinstance(typelike, typelike_cls):
-                return converter(typelike)
+        converter = cls._typelike_converter(type(typelike))
+        if converter is not None:
+            return converter(typelike)
 
         raise TypeError(f"Object {typelike} is not typelike")
 
+    @classmethod
+    @util.cache(max_size=256)
+    def _typelike_converter(cls, obj_type):
+        # Gets the converter for objects of type 'obj_type', or
+        # 'None' if they aren't typelike. This is cached so that
+        # each annotation doesn't need to check against every
+        # registered typelike class.
+        #
+        # The cache is cleared whenever typelikes are registered
+        # or unregistered.
+
+        for typelike_cls, converter in cls._typelikes.items():
+            if issubclass(obj_type, typelike_cls):
+                return converter
+
+        return None
+
     @classmethod
     def register_typelike(cls, typelike_cls, converter):
         """Registers a class as being convertible to a :class:`Type`.
@@ -154,6 +251,7 @@ class Type(abc.ABC):
         """
 
         cls._typelikes[typelike_cls] = converter
+        cls._typelike_converter.cache_clear()
 
     @classmethod
     def unregister_typelike(cls, typelike_cls):
@@ -166,6 +264,7 @@ class Type(abc.ABC):
         """
 
         cls._typelikes.pop(typelike_cls)
+        cls._typelike_converter.cache_clear()
 
     @classmethod
     def is_typelike(cls, obj):
@@ -185,11 +284,7 @@ class Type(abc.ABC):
         if isinstance(obj, type) and issubclass(obj, Type):
             return True
 
-        for typelike_cls in cls._typelikes.keys():
-            if isinstance(obj, typelike_cls):
-                return True
-
-        return False
+        return cls._typelike_converter(type(obj)) is not None
 
     @staticmethod
     def prepare_types(func):
@@ -208,27 +303,56 @@ class Type(abc.ABC):
         EmptyType
         """
 
+        # Work out which arguments need to be converted once,
+        # at decoration time, so that calls don't need to inspect
+        # the signature and bind each argument to its parameter.
+
+        type_positions      = []
+        var_positional_from = None
+        keyword_names       = set()
+        type_keywords       = set()
+        var_keyword_is_type = False
+
+        for i, param in enumerate(inspect.signature(func).parameters.values()):
+            is_type = (param.annotation is Type)
+
+            if param.kind == param.VAR_POSITIONAL:
+                if is_type:
+                    var_positional_from = i
+
+                continue
+
+            if param.kind == param.VAR_KEYWORD:
+                var_keyword_is_type = is_type
+
+                continue
+
+            if param.kind != param.KEYWORD_ONLY and is_type:
+                type_positions.append(i)
+
+            if param.kind != param.POSITIONAL_ONLY:
+                keyword_names.add(param.name)
+
+                if is_type:
+                    type_keywords.add(param.name)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            args_annotations, kwargs_annotations = util.bind_annotations(func, *args, **kwargs)
+            args = list(args)
 
-            new_args = [
-                Type(value) if annotation is Type
-                else value
+            for i in type_positions:
+                if i < len(args):
+                    args[i] = Type(args[i])
 
-                for value, annotation in args_annotations
-            ]
+            if var_positional_from is not None:
+                for i in range(var_positional_from, len(args)):
+                    args[i] = Type(args[i])
 
-            new_kwargs = {
-                name: (
-                    Type(value) if annotation is Type
-                    else value
-                )
+            for name, value in kwargs.items():
+                if name in type_keywords or (var_keyword_is_type and name not in keyword_names):
+                    kwargs[name] = Type(value)
 
-                for name, (value, annotation) in kwargs_annotations.items()
-            }
-
-            return func(*new_args, **new_kwargs)
+            return func(*args, **kwargs)
 
         return wrapper
 
@@ -252,13 +376,68 @@ class Type(abc.ABC):
 
         return Array(cls, index)
 
+    @classmethod
+    def _static_attr(cls, attr):
+        # Gets an attribute without invoking descriptors,
+        # like 'inspect.getattr_static' but only looking
+        # through the '__dict__'s of the MRO, which is all
+        # that is needed for these attributes and is much
+        # faster.
+
+        for base in cls.__mro__:
+            base_dict = base.__dict__
+            if attr in base_dict:
+                return base_dict[attr]
+
+        raise AttributeError(f"type object '{cls.__qualname__}' has no attribute '{attr}'")
+
+    @classmethod
+    def _static_owner(cls, attr):
+        # Gets the index in the MRO of the class which defines 'attr'.
+
+        for i, base in enumerate(cls.__mro__):
+            if attr in base.__dict__:
+                return i
+
+        raise AttributeError(f"type object '{cls.__qualname__}' has no attribute '{attr}'")
+
     @classmethod
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
 
-        cls._size      = DynamicValue(inspect.getattr_static(cls, "_size"))
-        cls._alignment = DynamicValue(inspect.getattr_static(cls, "_alignment"))
-        cls._default   = DynamicValue(inspect.getattr_static(cls, "_default"))
+        # Only attributes set on the class itself need to be
+        # converted, since inherited attributes were already
+        # converted when their class was initialized.
+        for attr in ("_size", "_alignment", "_default"):
+            if attr in cls.__dict__:
+                setattr(cls, attr, DynamicValue(cls.__dict__[attr]))
+
+        # Resolve how to get the size and default of the 'Type' once,
+        # so that 'size' and 'default' don't need to inspect their
+        # attributes on every call. If a getter is 'None', then its
+        # attribute is used as a constant value.
+        cls._size_getter    = None
+        cls._default_getter = None
+
+        if inspect.ismethod(cls._size):
+            cls._size_getter = cls._size
+        elif isinstance(cls._size, DynamicValue):
+            dynamic_size     = cls._size
+            cls._size_getter = lambda value, *, ctx: dynamic_size.get(ctx=ctx)
+
+        if inspect.ismethod(cls._default):
+            cls._default_getter = cls._default
+        elif isinstance(cls._default, DynamicValue):
+            cls._default_getter = cls._default.get
+
+        # Constant defaults which are immutable don't need to be copied.
+        cls._default_immutable = (cls._default_getter is None and _is_immutable(cls._default))
+
+        # An inherited '_unpack_from' may not match an '_unpack' which
+        # overrides it from a more derived class, e.g. from a mixin, so
+        # fall back to the generic implementation.
+        if cls._static_owner("_unpack") < cls._static_owner("_unpack_from"):
+            cls._unpack_from = Type.__dict__["_unpack_from"]
 
         # Set __new__ to _call's underlying function.
         # We don't just override __new__ instead of
@@ -306,8 +485,11 @@ class Type(abc.ABC):
 
     STATIC_SIZE = util.UniqueSentinel("STATIC_SIZE")
 
+    # NOTE: The caches for sizes and alignments are bounded since
+    # their keys may hold on to values and contexts, and through
+    # contexts, packets, which would otherwise never be freed.
     @classmethod
-    @util.cache(force_hashable=False)
+    @util.cache(force_hashable=False, max_size=1024)
     def size(cls, value=STATIC_SIZE, *, ctx=None):
         r"""Gets the size of the :class:`Type` when packed.
 
@@ -361,18 +543,18 @@ class Type(abc.ABC):
         """
 
         if ctx is None:
-            ctx = cls.Context()
+            ctx = _EMPTY_CTX
 
-        size = cls._size
+        size_getter = cls._size_getter
 
-        try:
-            if inspect.ismethod(size):
-                size = size(value, ctx=ctx)
-            elif isinstance(size, DynamicValue):
-                size = size.get(ctx=ctx)
+        if size_getter is None:
+            size = cls._size
+        else:
+            try:
+                size = size_getter(value, ctx=ctx)
 
-        except NoStaticSizeError:
-            size = None
+            except NoStaticSizeError:
+                size = None
 
         # If no (hopefully) performant calculation of a value's
         # packed size is available, then fallback to packing the value.
@@ -385,7 +567,7 @@ class Type(abc.ABC):
         return size
 
     @classmethod
-    @util.cache
+    @util.cache(max_size=1024)
     def alignment(cls, *, ctx=None):
         r"""Gets the alignment of the :class:`Type`.
 
@@ -437,7 +619,7 @@ class Type(abc.ABC):
         """
 
         if ctx is None:
-            ctx = cls.Context()
+            ctx = _EMPTY_CTX
 
         alignment = cls._alignment
         if inspect.ismethod(alignment):
@@ -451,7 +633,7 @@ class Type(abc.ABC):
         return alignment
 
     @staticmethod
-    @util.cache
+    @util.cache(max_size=1024)
     def alignment_padding_lengths(*types, total_alignment, ctx=None):
         r"""Gets the length of padding after each :class:`Type` for alignment purposes.
 
@@ -476,7 +658,7 @@ class Type(abc.ABC):
         # for more details.
 
         if ctx is None:
-            ctx = Type.Context()
+            ctx = _EMPTY_CTX
 
         padding_lengths = []
 
@@ -535,13 +717,14 @@ class Type(abc.ABC):
             raise TypeError(f"'{cls.__qualname__}' has no default value")
 
         if ctx is None:
-            ctx = cls.Context()
+            ctx = _EMPTY_CTX
 
-        if inspect.ismethod(cls._default):
-            return cls._default(ctx=ctx)
+        default_getter = cls._default_getter
+        if default_getter is not None:
+            return default_getter(ctx=ctx)
 
-        if isinstance(cls._default, DynamicValue):
-            return cls._default.get(ctx=ctx)
+        if cls._default_immutable:
+            return cls._default
 
         # Deepcopy because the default could be mutable.
         return copy.deepcopy(cls._default)
@@ -570,13 +753,55 @@ class Type(abc.ABC):
             The corresponding value of the buffer.
         """
 
-        buf = util.file_object(buf)
-
         if ctx is None:
-            ctx = cls.Context()
+            ctx = _EMPTY_CTX
+
+        # Raw data can be unpacked directly, without
+        # needing to be wrapped in a file object.
+        if isinstance(buf, (bytes, bytearray)):
+            return cls._unpack_from(buf, 0, ctx=ctx)[0]
 
         return cls._unpack(buf, ctx=ctx)
 
+    @classmethod
+    def unpack_from(cls, buf, offset=0, *, ctx=None):
+        """Unpacks raw data at an offset into its corresponding value.
+
+        .. warning::
+
+            Do **not** override this method. Instead override
+            :meth:`_unpack_from`.
+
+        Parameters
+        ----------
+        buf : :class:`bytes` or :class:`bytearray`
+            The buffer containing the raw data.
+        offset : :class:`int`
+            The offset into ``buf`` to start unpacking from.
+        ctx : :class:`Type.Context` or ``None``
+            The context for the :class:`Type`.
+
+            If ``None``, then an empty :class:`Type.Context` is used.
+
+        Returns
+        -------
+        any
+            The corresponding value of the buffer.
+        :class:`int`
+            The offset into ``buf`` after the unpacked data.
+
+        Examples
+        --------
+        >>> import pak
+        >>> pak.Int8.unpack_from(b"\\x01\\x02", 1)
+        (2, 2)
+        """
+
+        if ctx is None:
+            ctx = _EMPTY_CTX
+
+        return cls._unpack_from(buf, offset, ctx=ctx)
+
     @classmethod
     def pack(cls, value, *, ctx=None):
         """Packs a value into its corresponding raw data.
@@ -602,12 +827,11 @@ class Type(abc.ABC):
         """
 
         if ctx is None:
-            ctx = cls.Context()
+            ctx = _EMPTY_CTX
 
         return cls._pack(value, ctx=ctx)
 
     @classmethod
-    @abc.abstractmethod
     def _unpack(cls, buf, *, ctx):
         """Unpacks raw data into its corresponding value.
 
@@ -634,7 +858,46 @@ class Type(abc.ABC):
         raise NotImplementedError
 
     @classmethod
-    @abc.abstractmethod
+    def _unpack_from(cls, buf, offset, *, ctx):
+        """Unpacks raw data at an offset into its corresponding value.
+
+        May be overridden by subclasses which can unpack
+        directly from a buffer without a file object.
+
+        By default this wraps ``buf`` in a file object
+        and calls :meth:`_unpack`.
+
+        .. warning::
+
+            Do not use this method directly, **always** use
+            :meth:`unpack_from` instead.
+
+        Parameters
+        ----------
+        buf : :class:`bytes` or :class:`bytearray`
+            The buffer containing the raw data.
+        offset : :class:`int`
+            The offset into ``buf`` to start unpacking from.
+        ctx : :class:`Type.Context`
+            The context for the :class:`Type`.
+
+        Returns
+        -------
+        any
+            The corresponding value from the buffer.
+        :class:`int`
+            The offset into ``buf`` after the unpacked data.
+        """
+
+        # NOTE: Wrapping 'bytes' in 'io.BytesIO' doesn't copy the data.
+        buf_file = io.BytesIO(buf)
+        buf_file.seek(offset)
+
+        value = cls._unpack(buf_file, ctx=ctx)
+
+        return value, buf_file.tell()
+
+    @classmethod
     def _pack(cls, value, *, ctx):
         """Packs a value into its corresponding raw data.
 
@@ -763,7 +1026,7 @@ class Type(abc.ABC):
             not length prefixes or anything of that sort.
         """
 
-        return b"".join(cls.pack(x, ctx=ctx) for x in value)
+        return b"".join([cls.pack(x, ctx=ctx) for x in value])
 
     @classmethod
     def _array_transform_value(cls, value):
@@ -788,18 +1051,16 @@ class Type(abc.ABC):
 
     # TODO: When Python 3.7 support is dropped, make 'name' and 'bases' positional-only.
     @classmethod
-    @util.cache(force_hashable=False)
     def make_type(cls, name, bases=None, **namespace):
         """Utility for generating new types.
 
         The generated type's :attr:`__module__` attribute is
-        set to be the same as the origin type's. This is done to
-        get around an issue where generated types would have
-        their :attr:`__module__` attribute be ``"abc"`` because
-        :class:`Type` inherits from :class:`abc.ABC`.
+        set to be the same as the origin type's, instead of
+        the module where :meth:`make_type` is defined.
 
         This method is cached so a new type is only made if it
-        hasn't been made before.
+        hasn't been made before. If any arguments are unhashable,
+        then a new type is always made.
 
         Parameters
         ----------
@@ -818,6 +1079,23 @@ class Type(abc.ABC):
             The generated type.
         """
 
+        key = (cls, name, bases, tuple(namespace.items()))
+
+        try:
+            return cls._make_type_cache[key]
+
+        except KeyError:
+            made_type = cls._make_type_uncached(name, bases, namespace)
+            cls._make_type_cache[key] = made_type
+
+            return made_type
+
+        except TypeError:
+            # Unhashable arguments bypass the cache.
+            return cls._make_type_uncached(name, bases, namespace)
+
+    @classmethod
+    def _make_type_uncached(cls, name, bases, namespace):
         if bases is None:
             bases = (cls,)
 
@@ -834,3 +1112,10 @@ class Type(abc.ABC):
         # generating new types.
 
         raise NotImplementedError
+
+# A shared empty context, used when no context is passed
+# to avoid constructing a new one for each call. Since
+# 'Type.Context' is immutable, this is safe to share.
+_EMPTY_CTX = Type.Context()
+
+Type.Context._empty = _EMPTY_CTX
@@ -127,3 +127,11 @@ def bind_annotations(func, *args, **kwargs):
         kwargs_annotations[name] = (value, param.annotation)
 
     return args_annotations, kwargs_annotations
+
+def _is_specialized(method):
+    # Whether a method was generated to specialize a generic one,
+    # marked by its '_specialized' attribute. Used internally to tell
+    # specialized methods apart from overrides when looking through
+    # the parents of a class.
+
+    return getattr(getattr(method, "__func__", method), "_specialized", False)
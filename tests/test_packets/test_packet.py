@@ -39,6 +39,176 @@ def test_packet():
     with pytest.raises(TypeError, match="Unexpected keyword arguments"):
         BasicPacket(test=0)
 
+def test_specialized_methods():
+    class TestOverride(pak.Packet):
+        field: pak.Int8
+
+        @classmethod
+        def unpack(cls, buf, *, ctx=None):
+            return "overridden"
+
+        def __repr__(self):
+            return "overridden"
+
+    class TestOverrideChild(TestOverride):
+        other: pak.Int8
+
+    # Overrides are inherited instead of being specialized away.
+    assert TestOverrideChild.unpack(b"\x01\x02") == "overridden"
+    assert repr(TestOverrideChild())            == "overridden"
+
+    assert TestOverrideChild(field=1, other=2).pack() == b"\x01\x02"
+
+    # Specialized methods keep the metadata of the generic ones.
+    assert TestOverride.__init__.__doc__            == pak.Packet.__init__.__doc__
+    assert TestOverride.__init__.__wrapped__        is pak.Packet.__init__
+    assert TestOverride.pack_without_header.__doc__ == pak.Packet.pack_without_header.__doc__
+
+    class TestMixin(pak.Packet):
+        def pack_without_header(self, *, ctx=None):
+            return b"mixin"
+
+    class TestSpecialized(pak.Packet):
+        field: pak.Int8
+
+    # An override later in the MRO is not shadowed
+    # by a method specialized for an earlier parent.
+    class TestShadow(TestSpecialized, TestMixin):
+        pass
+
+    assert TestShadow().pack() == b"mixin"
+
+    class TestSuper(TestSpecialized):
+        other: pak.Int8
+
+        def __init__(self, *, ctx=None, **fields):
+            super().__init__(ctx=ctx, **fields)
+
+        def pack_without_header(self, *, ctx=None):
+            return super().pack_without_header(ctx=ctx)
+
+    # Methods specialized for a parent still handle
+    # the fields of a child calling them through 'super()'.
+    assert TestSuper(field=1, other=2).pack() == b"\x01\x02"
+
+    with pytest.raises(TypeError, match="Unexpected keyword arguments"):
+        TestSuper(bad=0)
+
+    class TestCooperativeMixin(pak.Packet):
+        def __init__(self, *, ctx=None, **fields):
+            self.initialized = True
+
+            super().__init__(ctx=ctx, **fields)
+
+        def pack_without_header(self, *, ctx=None):
+            return b"mixin" + super().pack_without_header(ctx=ctx)
+
+        @classmethod
+        def unpack(cls, buf, *, ctx=None):
+            self = super().unpack(buf, ctx=ctx)
+            self.mixed = True
+
+            return self
+
+        def __eq__(self, other):
+            return getattr(other, "mixed", False) and super().__eq__(other)
+
+        def __repr__(self):
+            return "mixin:" + super().__repr__()
+
+    class TestCooperative(TestSpecialized, TestCooperativeMixin):
+        other: pak.Int8
+
+        def __init__(self, *, ctx=None, **fields):
+            super().__init__(ctx=ctx, **fields)
+
+        def pack_without_header(self, *, ctx=None):
+            return super().pack_without_header(ctx=ctx)
+
+        @classmethod
+        def unpack(cls, buf, *, ctx=None):
+            return super().unpack(buf, ctx=ctx)
+
+        def __eq__(self, other):
+            return super().__eq__(other)
+
+        def __repr__(self):
+            return super().__repr__()
+
+    # Methods specialized for a parent defer to the rest of
+    # the MRO when reached through 'super()' from a child.
+    p = TestCooperative(field=1, other=2)
+
+    assert p.initialized
+    assert p.pack() == b"mixin\x01\x02"
+    assert repr(p).startswith("mixin:")
+    assert TestCooperative.unpack(b"\x01\x02").mixed
+    assert p != TestCooperative(field=1, other=2)
+    assert p == TestCooperative.unpack(b"\x01\x02")
+
+def test_fused_struct_packet():
+    class TestFused(pak.Packet):
+        first:  pak.Int8
+        second: pak.UInt16
+
+        @property
+        def read_only(self):
+            return 1
+
+        read_only: pak.Int8
+
+    pak.test.packet_behavior(
+        (TestFused(first=1, second=2), b"\x01\x02\x00\x01"),
+    )
+
+    assert TestFused.unpack(bytearray(b"\x01\x02\x00\x05")) == TestFused(first=1, second=2)
+
+    # Values the combined struct can't handle
+    # are still handled by each field's type.
+    assert TestFused(first=[1], second=2).pack() == b"\x01\x02\x00\x01"
+
+    class TestMixed(pak.Packet):
+        first:   pak.Int8
+        second:  pak.UInt16
+        dynamic: pak.ULEB128
+        third:   pak.Int8
+        fourth:  pak.Int8
+
+    # Runs of simple fields are fused around other fields.
+    pak.test.packet_behavior(
+        (TestMixed(first=1, second=2, dynamic=3, third=4, fourth=5), b"\x01\x02\x00\x03\x04\x05"),
+    )
+
+    assert TestMixed(first=[1], second=2, dynamic=3, third=4, fourth=[5]).pack() == b"\x01\x02\x00\x03\x04\x05"
+
+    class TestOrder(pak.Packet):
+        dynamic: pak.ULEB128
+        first:   pak.Int8
+        second:  pak.Int8
+
+    # Fields are still packed in order, so the
+    # first field with a bad value raises.
+    with pytest.raises(TypeError):
+        TestOrder(dynamic="bad", first=1, second=b"bad").pack()
+
+    class TestBytes(pak.Packet):
+        first:  pak.Int8
+        data:   pak.RawByte[2]
+        second: pak.UInt16
+
+    # Fixed size 'RawByte' arrays are fused as byte strings.
+    pak.test.packet_behavior(
+        (TestBytes(first=1, data=b"ab", second=2), b"\x01ab\x02\x00"),
+    )
+
+    assert isinstance(TestBytes.unpack(b"\x01ab\x02\x00").data, bytearray)
+
+    assert TestBytes(first=1, data=[1, 2], second=2).pack() == b"\x01\x01\x02\x02\x00"
+
+    # The errors of each field are raised when there's not enough data.
+    with pytest.raises(pak.util.BufferOutOfDataError):
+        TestBytes.unpack(b"\x01a")
+
 def test_packet_context():
     assert hash(pak.Packet.Context()) == hash(pak.Packet.Context())
 
@@ -231,6 +401,9 @@ def test_packet_multiple_inheritance():
             pass
 
 def test_header():
+    # The name of 'Packet.Header' is set after it is created.
+    assert repr(pak.Packet.Header()) == "Packet.Header()"
+
     class Test(pak.Packet):
         class Header(pak.Packet.Header):
             size: pak.UInt8
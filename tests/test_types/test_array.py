@@ -2,59 +2,75 @@ import io
 import pak
 import pytest
 
-def test_array():
-    assert issubclass(pak.Int8[2], pak.Array)
+class ArrayAttrPacket(pak.Packet):
+    test:  pak.Int8
+    array: pak.Int8["test"]
 
-    pak.test.type_behavior(
-        pak.Int8[2],
+@pytest.mark.parametrize(
+    "type_cls, values_and_data, static_size, alignment, default",
 
-        ([0, 1], b"\x00\x01"),
+    [
+        (
+            pak.Int8[2],
 
-        static_size = 2,
-        alignment   = 1,
-        default     = [0, 0],
-    )
+            [([0, 1], b"\x00\x01")],
 
-    pak.test.type_behavior(
-        pak.Int8[pak.Int8],
+            2, 1, [0, 0],
+        ),
 
-        ([0, 1], b"\x02\x00\x01"),
-        ([],     b"\x00"),
+        (
+            pak.Int8[pak.Int8],
 
-        static_size = None,
-        default     = [],
-    )
+            [
+                ([0, 1], b"\x02\x00\x01"),
+                ([],     b"\x00"),
+            ],
+
+            None, None, [],
+        ),
+
+        (
+            pak.Int8[None],
 
+            [([0, 1, 2], b"\x00\x01\x02")],
+
+            None, None, [],
+        ),
+    ],
+
+    ids = ["fixed", "prefixed", "until_end"],
+)
+def test_array_behavior(type_cls, values_and_data, static_size, alignment, default):
     pak.test.type_behavior(
-        pak.Int8[None],
+        type_cls,
 
-        ([0, 1, 2], b"\x00\x01\x02"),
+        *values_and_data,
 
-        static_size = None,
-        default     = [],
+        static_size = static_size,
+        alignment   = alignment,
+        default     = default,
     )
 
+def test_array():
+    assert issubclass(pak.Int8[2], pak.Array)
+
     assert pak.Int8[2].pack([1]) == b"\x01\x00"
 
     # Conveniently testing string sizes will also
     # test function sizes.
     assert pak.Int8["test"].has_size_function()
 
-    class TestAttr(pak.Packet):
-        test:  pak.Int8
-        array: pak.Int8["test"]
-
-    assert TestAttr(test=2).array == [0, 0]
+    assert ArrayAttrPacket(test=2).array == [0, 0]
 
     # Test you can properly delete array attributes.
-    p = TestAttr()
+    p = ArrayAttrPacket()
     del p.array
 
     pak.test.packet_behavior(
-        (TestAttr(test=2, array=[0, 1]), b"\x02\x00\x01"),
+        (ArrayAttrPacket(test=2, array=[0, 1]), b"\x02\x00\x01"),
     )
 
-    ctx_len_2 = TestAttr(test=2, array=[0, 1]).type_ctx(None)
+    ctx_len_2 = ArrayAttrPacket(test=2, array=[0, 1]).type_ctx(None)
     pak.test.type_behavior(
         pak.Int8["test"],
 
@@ -73,4 +89,67 @@ def test_array():
         pak.Int8[pak.Int8].unpack(b"\x01")
 
     with pytest.raises(Exception):
-        TestAttr.unpack(b"\x01")
+        ArrayAttrPacket.unpack(b"\x01")
+
+def test_struct_array():
+    pak.test.type_behavior(
+        pak.UInt16[2],
+
+        ([1, 2], b"\x01\x00\x02\x00"),
+
+        static_size = 4,
+        alignment   = 2,
+        default     = [0, 0],
+    )
+
+    # Trailing data too short for an element is ignored.
+    assert pak.UInt16[None].unpack(b"\x01\x00\x02") == [1]
+
+    # Values which aren't sized are still packed.
+    assert pak.UInt16[2].pack(x for x in (1, 2)) == b"\x01\x00\x02\x00"
+
+    # Values the combined struct can't handle
+    # are still handled by each element's type.
+    assert pak.UInt16[2].pack([[1], 2]) == b"\x01\x00\x02\x00"
+
+    with pytest.raises(Exception):
+        pak.UInt16[2].unpack(b"\x01\x00\x02")
+
+    # A negative size unpacks no elements.
+    assert pak.Int16[pak.Int8].unpack(b"\xFE\x01\x00") == []
+
+def test_uint8_array():
+    pak.test.type_behavior(
+        pak.UInt8[2],
+
+        ([1, 2], b"\x01\x02"),
+
+        static_size = 2,
+        alignment   = 1,
+        default     = [0, 0],
+    )
+
+    pak.test.type_behavior(
+        pak.UInt8[None],
+
+        ([1, 2, 3], b"\x01\x02\x03"),
+
+        static_size = None,
+        default     = [],
+    )
+
+    assert pak.UInt8[2].pack([1]) == b"\x01\x00"
+
+    with pytest.raises(Exception):
+        pak.UInt8[2].pack([256, 0])
+
+    with pytest.raises(Exception):
+        pak.UInt8[2].unpack(b"\x01")
+
+    class TestNegativeSize(pak.Packet):
+        size:  pak.Int8
+        array: pak.UInt8["size"]
+        rest:  pak.RawByte[None]
+
+    # A negative size doesn't read the rest of the data.
+    assert TestNegativeSize.unpack(b"\xFE\x01\x02\x03\x04") == TestNegativeSize(size=-2, array=[], rest=b"\x01\x02\x03\x04")
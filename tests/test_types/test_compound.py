@@ -34,6 +34,36 @@ def test_static_compound():
 
     assert isinstance(TestAttrSet(compound=(0, 0, "aa")).compound, TestStaticCompound.value_type)
 
+def test_compound_array():
+    TestStructCompound = pak.Compound(
+        "TestStructCompound",
+
+        first  = pak.Int8,
+        second = pak.Int16,
+    )
+
+    pak.test.type_behavior(
+        TestStructCompound[2],
+
+        ([(1, 2), (3, 4)], b"\x01\x02\x00\x03\x04\x00"),
+
+        static_size = 6,
+        default     = [(0, 0), (0, 0)],
+    )
+
+    assert isinstance(TestStructCompound[2].unpack(b"\x00" * 6)[0], TestStructCompound.value_type)
+
+    # Values which aren't sized are not consumed before falling back.
+    assert TestStructCompound[2].pack(x for x in [(1, 2), ([3], 4)]) == b"\x01\x02\x00\x03\x04\x00"
+
+    class TestNegativeSize(pak.Packet):
+        size:  pak.Int8
+        array: TestStructCompound["size"]
+        rest:  pak.RawByte[None]
+
+    # A negative size doesn't read the rest of the data.
+    assert TestNegativeSize.unpack(b"\xFE\x01\x02\x03") == TestNegativeSize(size=-2, array=[], rest=b"\x01\x02\x03")
+
 def test_dynamic_compound():
     TestDynamicCompound = pak.Compound(
         "TestDynamicCompound",
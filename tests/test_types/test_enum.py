@@ -23,9 +23,19 @@ def test_static_enum():
 
     assert EnumStatic.size(pak.Enum.INVALID) == 1
 
-    with pytest.raises(ValueError, match="invalid value"):
+    with pytest.raises(ValueError, match=r"invalid value for Enum\(Int8, EnumRaw\)"):
         EnumStatic.pack(pak.Enum.INVALID)
 
+    assert not hasattr(pak.Enum.INVALID, "value")
+
+    class CustomDefault(pak.Enum):
+        @classmethod
+        def _default(cls, *, ctx):
+            return EnumRaw.B
+
+    # Customized defaults are kept for generated enum types.
+    assert CustomDefault(pak.Int8, EnumRaw).default() is EnumRaw.B
+
 def test_dynamic_enum():
     EnumDynamic = pak.Enum(pak.LEB128, EnumRaw)
 
@@ -41,3 +51,35 @@ def test_dynamic_enum():
 
     with pytest.raises(ValueError, match="invalid value"):
         EnumDynamic.size(pak.Enum.INVALID)
+
+def test_flag_enum():
+    class FlagRaw(enum.Flag):
+        A = 1
+        B = 2
+
+    EnumFlag = pak.Enum(pak.Int8, FlagRaw)
+
+    # Members which aren't defined directly
+    # are still looked up through the enum.
+    assert EnumFlag.unpack(b"\x03") == FlagRaw.A | FlagRaw.B
+
+def test_specialized_enum():
+    EnumStatic = pak.Enum(pak.Int8, EnumRaw)
+
+    class TestOverride(EnumStatic):
+        @classmethod
+        def _unpack(cls, buf, *, ctx):
+            return EnumRaw.B
+
+    # Overrides are used instead of being specialized away.
+    assert TestOverride.unpack(b"\x01") is EnumRaw.B
+
+    class EnumOther(enum.Enum):
+        C = 3
+
+    class TestChangedEnum(EnumStatic):
+        enum_type = EnumOther
+
+    # Methods specialized for a parent don't apply to its children.
+    assert TestChangedEnum.unpack(b"\x03") is EnumOther.C
+    assert TestChangedEnum.default()       is EnumOther.C
@@ -1,7 +1,16 @@
 import io
+import struct
 import pak
 import pytest
 
+class PaddingAttrPacket(pak.Packet):
+    test:  pak.Int8
+    array: pak.Padding["test"]
+
+class RawByteAttrPacket(pak.Packet):
+    test:  pak.Int8
+    array: pak.RawByte["test"]
+
 def test_empty():
     assert pak.Type(None) is pak.EmptyType
 
@@ -11,6 +20,8 @@ def test_empty():
     assert pak.EmptyType.unpack(buf) is None
     assert buf.tell() == 0
 
+    assert pak.EmptyType.unpack_from(b"test", 1) == (None, 1)
+
     assert pak.EmptyType.pack("whatever value") == b""
 
     assert pak.EmptyType.size() == 0
@@ -36,9 +47,14 @@ def test_padding():
 
     assert pak.Padding.pack("whatever value") == b"\x00"
 
+    assert pak.Padding.unpack_from(b"test", 1) == (None, 2)
+
     with pytest.raises(pak.util.BufferOutOfDataError):
         pak.Padding.unpack(b"")
 
+    with pytest.raises(pak.util.BufferOutOfDataError):
+        pak.Padding.unpack_from(b"test", 4)
+
     assert pak.Padding.size() == 1
 
     class TestDescriptor(pak.Packet):
@@ -72,24 +88,37 @@ def test_padding_array():
     assert pak.Padding[None].unpack(buf) is None
     assert buf.tell() == 9
 
+    # A negative size doesn't read the rest of the data.
+    buf = io.BytesIO(b"\xFE\x00\x00")
+    assert pak.Padding[pak.Int8].unpack(buf) is None
+    assert buf.tell() == 1
+
+    # Offsets are threaded through without a file object.
+    data   = b"\x00\x00\x01\x00\x00"
+    offset = 0
+
+    value, offset = pak.Padding[2].unpack_from(data, offset)
+    assert value is None and offset == 2
+
+    value, offset = pak.Padding[pak.Int8].unpack_from(data, offset)
+    assert value is None and offset == 4
+
+    assert pak.Padding[None].unpack_from(b"test data", 2) == (None, 9)
+
     with pytest.raises(pak.NoStaticSizeError):
         pak.Padding[None].size()
 
-    class TestAttr(pak.Packet):
-        test:  pak.Int8
-        array: pak.Padding["test"]
-
-    assert TestAttr(test=2).array is None
+    assert PaddingAttrPacket(test=2).array is None
 
     buf = io.BytesIO(b"\x02\xAA\xBB\xCC")
-    p   = TestAttr.unpack(buf)
+    p   = PaddingAttrPacket.unpack(buf)
     assert p.test == 2 and p.array is None
     assert buf.tell() == 3
 
     # Test you can properly delete padding array attributes.
     del p.array
 
-    ctx_len_2 = TestAttr(test=2).type_ctx(None)
+    ctx_len_2 = PaddingAttrPacket(test=2).type_ctx(None)
     pak.Padding["test"].size(ctx=ctx_len_2) == 2
 
     assert pak.Padding[2].pack(None)             == b"\x00\x00"
@@ -99,15 +128,6 @@ def test_padding_array():
 
     assert pak.Padding[None].pack("whatever value") == b""
 
-    with pytest.raises(pak.util.BufferOutOfDataError):
-        pak.Padding[2].unpack(b"\x00")
-
-    with pytest.raises(pak.util.BufferOutOfDataError):
-        pak.Padding[pak.Int8].unpack(b"\x01")
-
-    with pytest.raises(pak.util.BufferOutOfDataError):
-        TestAttr.unpack(b"\x01")
-
 def test_raw_byte():
     pak.test.type_behavior(
         pak.RawByte,
@@ -123,52 +143,64 @@ def test_raw_byte():
     with pytest.raises(pak.util.BufferOutOfDataError):
         pak.RawByte.unpack(b"")
 
-def test_raw_byte_array():
-    assert pak.RawByte[2].default() == b"\x00\x00"
+# Values are actually bytearrays but will still
+# have equality with bytes objects.
+@pytest.mark.parametrize(
+    "type_cls, values_and_data, static_size, default",
 
-    assert isinstance(pak.RawByte[1].unpack(b"\x00"), bytearray)
+    [
+        (
+            pak.RawByte[2],
 
-    # Values are actually bytearrays but will still
-    # have equality with bytes objects.
-    pak.test.type_behavior(
-        pak.RawByte[2],
+            [(b"\xAA\xBB", b"\xAA\xBB")],
 
-        (b"\xAA\xBB", b"\xAA\xBB"),
+            2, b"\x00\x00",
+        ),
 
-        static_size = 2,
-        default     = b"\x00\x00",
-    )
+        (
+            pak.RawByte[pak.Int8],
 
-    pak.test.type_behavior(
-        pak.RawByte[pak.Int8],
+            [
+                (b"\xAA\xBB", b"\x02\xAA\xBB"),
+                (b"",         b"\x00"),
+            ],
 
-        (b"\xAA\xBB", b"\x02\xAA\xBB"),
-        (b"",         b"\x00"),
+            None, b"",
+        ),
 
-        static_size = None,
-        default     = b"",
-    )
+        (
+            pak.RawByte[None],
+
+            [(b"\xAA\xBB\xCC", b"\xAA\xBB\xCC")],
+
+            None, b"",
+        ),
+    ],
 
+    ids = ["fixed", "prefixed", "until_end"],
+)
+def test_raw_byte_array_behavior(type_cls, values_and_data, static_size, default):
     pak.test.type_behavior(
-        pak.RawByte[None],
+        type_cls,
 
-        (b"\xAA\xBB\xCC", b"\xAA\xBB\xCC"),
+        *values_and_data,
 
-        static_size = None,
-        default     = b"",
+        static_size = static_size,
+        default     = default,
     )
 
-    class TestAttr(pak.Packet):
-        test: pak.Int8
-        array: pak.RawByte["test"]
+def test_raw_byte_array():
+    assert pak.RawByte[2].default() == b"\x00\x00"
 
-    assert TestAttr(test=2).array == b"\x00\x00"
+    assert isinstance(pak.RawByte[1].unpack(b"\x00"), bytearray)
+
+    assert RawByteAttrPacket(test=2).array == b"\x00\x00"
 
     pak.test.packet_behavior(
-        (TestAttr(test=2, array=b"\x00\x01"), b"\x02\x00\x01"),
+        (RawByteAttrPacket(test=2, array=b"\x00\x01"), b"\x02\x00\x01"),
     )
 
-    ctx_len_2 = TestAttr(test=2, array=b"\x00\x01").type_ctx(None)
+    ctx_len_2 = RawByteAttrPacket(test=2, array=b"\x00\x01").type_ctx(None)
     pak.test.type_behavior(
         pak.RawByte["test"],
 
@@ -183,14 +215,42 @@ def test_raw_byte_array():
     assert pak.RawByte[2].pack(b"\xAA")                  == b"\xAA\x00"
     assert pak.RawByte[pak.Int8].unpack(b"\x02\xAA\xBB\xCC") == b"\xAA\xBB"
 
-    with pytest.raises(pak.util.BufferOutOfDataError):
-        pak.RawByte[2].unpack(b"\x00")
+    assert pak.RawByte[pak.Int8].unpack_from(b"\xFF\x02\xAA\xBB\xCC", 1) == (b"\xAA\xBB", 4)
 
-    with pytest.raises(pak.util.BufferOutOfDataError):
-        pak.RawByte[pak.Int8].unpack(b"\x01")
+    class ReadOnlyFile:
+        def __init__(self, data):
+            self.data = data
+
+        def read(self, size=-1):
+            data, self.data = self.data[:size], self.data[size:]
+
+            return data
+
+    # A negative size doesn't read the rest of the data.
+    assert pak.RawByte[pak.Int8].unpack(b"\xFE\x01\x02") == b""
 
+    # File objects without 'readinto' are still supported.
+    assert pak.RawByte[2].unpack(ReadOnlyFile(b"\xAA\xBB\xCC")) == b"\xAA\xBB"
+
+    with pytest.raises(pak.util.BufferOutOfDataError):
+        pak.RawByte[2].unpack(ReadOnlyFile(b"\xAA"))
+
+@pytest.mark.parametrize(
+    "type_cls, data",
+
+    [
+        (pak.Padding[2],        b"\x00"),
+        (pak.Padding[pak.Int8], b"\x01"),
+        (PaddingAttrPacket,     b"\x01"),
+
+        (pak.RawByte[2],        b"\x00"),
+        (pak.RawByte[pak.Int8], b"\x01"),
+        (RawByteAttrPacket,     b"\x01"),
+    ],
+)
+def test_array_out_of_data(type_cls, data):
     with pytest.raises(pak.util.BufferOutOfDataError):
-        TestAttr.unpack(b"\x01")
+        type_cls.unpack(data)
 
 def test_struct():
     # StructType also gets tested further
@@ -221,3 +281,35 @@ def test_struct():
         static_size = 3,
         default     = pak.test.NO_DEFAULT,
     )
+
+    class TestOverride(pak.Int8):
+        @classmethod
+        def _pack(cls, value, *, ctx):
+            return super()._pack(value + 1, ctx=ctx)
+
+        @classmethod
+        def _unpack(cls, buf, *, ctx):
+            return super()._unpack(buf, ctx=ctx) - 1
+
+    # Overriding the marshaling methods of a
+    # StructType disables its fast paths.
+    pak.test.type_behavior(
+        TestOverride,
+
+        (1, b"\x02"),
+
+        static_size = 1,
+        alignment   = 1,
+        default     = 0,
+    )
+
+    # Iterable values are still unpacked into the
+    # '?' format, even though it accepts any object.
+    assert pak.Bool.pack([0]) == b"\x00"
+
+    class TestBool(pak.Packet):
+        byte: pak.Int8
+        flag: pak.Bool
+
+    with pytest.raises(struct.error):
+        TestBool(flag=b"abc").pack()
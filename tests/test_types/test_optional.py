@@ -42,6 +42,13 @@ def test_optional():
         (TestAttr(test=True),  b"\x01\x00"),
     )
 
+    # Sizes don't go stale when the packet changes.
+    p = TestAttr(test=True, optional=1)
+    assert p.size() == 2
+
+    p.test = False
+    assert p.size() == 1
+
     ctx_false = TestAttr(test=False).type_ctx(None)
     ctx_true  = TestAttr(test=True).type_ctx(None)
 
@@ -1,3 +1,4 @@
+import copy
 import pak
 import pytest
 
@@ -40,9 +41,25 @@ def test_type_context():
     with pytest.raises(AttributeError):
         pak.Type.Context().test
 
+    # Empty contexts are shared since they're immutable.
+    assert pak.Type.Context() is pak.Type.Context()
+
     with pytest.raises(TypeError, match="immutable"):
         type_ctx.packet = None
 
+    # Contexts without a packet are equal if their packet contexts are.
+    assert pak.Type.Context(ctx=packet_ctx) == pak.Type.Context(ctx=MyPacketContext("test"))
+    assert hash(pak.Type.Context(ctx=packet_ctx)) == hash(pak.Type.Context(ctx=MyPacketContext("test")))
+
+    # Contexts with a packet are only equal to themselves,
+    # since the packet could change between uses.
+    assert type_ctx == type_ctx
+    assert type_ctx != p.type_ctx(packet_ctx)
+
+    # Copies are reconstructed despite being immutable.
+    type_ctx_copy = copy.copy(type_ctx)
+    assert type_ctx_copy.packet is p and type_ctx_copy.attr == "test"
+
 def test_typelike():
     assert pak.Type.is_typelike(pak.Int8)
     assert pak.Type(pak.Int8) is pak.Int8
@@ -68,6 +85,14 @@ def test_prepare_types():
     # Nones will be converted to EmptyType
     test(1, None, None, None, test=None, other_test=None)
 
+    @pak.Type.prepare_types
+    def test_keywords(x, y: pak.Type, *, z: pak.Type, **kwargs):
+        assert x is None
+        assert issubclass(y, pak.Type) and issubclass(z, pak.Type)
+        assert all(value is None for value in kwargs.values())
+
+    test_keywords(None, y=None, z=None, other_test=None)
+
 def test_static_size():
     class TestStaticSize(pak.Type):
         _size = 4
@@ -150,6 +175,13 @@ def test_static_default():
     assert Test.default() == [1, 2, 3]
     assert Test.default() is not Test._default
 
+    class TestNested(pak.Type):
+        _default = (1, [2])
+
+    # Tuples are still copied when they contain mutable values.
+    assert TestNested.default() == (1, [2])
+    assert TestNested.default()[1] is not TestNested._default[1]
+
 def test_no_default():
     class Test(pak.EmptyType):
         _default = None
@@ -174,6 +206,30 @@ def test_dynamic_value_default():
 
         assert TestDefault.default() == 1
 
+def test_unpack_from():
+    assert pak.Int8.unpack_from(b"\x01\x02")    == (1, 1)
+    assert pak.Int8.unpack_from(b"\x01\x02", 1) == (2, 2)
+
+    class TestOverride(pak.Int8):
+        @classmethod
+        def _unpack(cls, buf, *, ctx):
+            return super()._unpack(buf, ctx=ctx) + 1
+
+    # An overridden '_unpack' is used over an inherited '_unpack_from'.
+    assert TestOverride.unpack_from(b"\x01\x02", 1) == (3, 2)
+
+    class TestMixin:
+        @classmethod
+        def _unpack(cls, buf, *, ctx):
+            return super()._unpack(buf, ctx=ctx) + 1
+
+    class TestMixinOverride(TestMixin, pak.Int8):
+        pass
+
+    # The same goes for an '_unpack' overridden by a mixin.
+    assert TestMixinOverride.unpack(b"\x01")             == 2
+    assert TestMixinOverride.unpack_from(b"\x01\x02", 1) == (3, 2)
+
 def test_cached_make_type():
     class TestCall(pak.Type):
         @classmethod
@@ -189,6 +245,9 @@ def test_not_implemented_methods():
     with pytest.raises(NotImplementedError):
         pak.Type.unpack(b"")
 
+    with pytest.raises(NotImplementedError):
+        pak.Type.unpack_from(b"")
+
     with pytest.raises(NotImplementedError):
         pak.Type.pack(None)
 